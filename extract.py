@@ -10,18 +10,31 @@ content hash of zetta_utils/**/*.py.
 """
 from __future__ import annotations
 
+import collections
+import collections.abc
+import contextlib
+import functools
 import hashlib
 import inspect
+import itertools
 import json
+import math
 import os
 import re
 import shutil
 import sys
+import tempfile
 import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from types import NoneType, UnionType
-from typing import Any, get_args, get_origin
+from typing import Any, NamedTuple, get_args, get_origin
+
+try:
+    import orjson
+except ImportError:  # optional; not every zetta_utils venv has it
+    orjson = None
 
 # ─────────────────────────────────────────────────────────────
 # Cache key
@@ -98,10 +111,71 @@ def _cache_root(zu_pkg_dir: Path) -> Path:
     return zu_pkg_dir.parent / ".zetta_cue_cache"
 
 
+# ─────────────────────────────────────────────────────────────
+# Memoization
+# ─────────────────────────────────────────────────────────────
+
+
+def _memoize(maxsize: int | None = None):
+    """functools.lru_cache for single-argument helpers that tolerates
+    unhashable arguments (e.g. a wrapper instance defining __eq__ only) by
+    calling through uncached.
+
+    The registry repeats the same callables thousands of times, so the
+    introspection helpers below are memoized. Cached results are shared
+    between callers and must not be mutated. Annotations use
+    _memoize_by_identity instead.
+    """
+
+    def deco(fn):
+        cached = functools.lru_cache(maxsize=maxsize)(fn)
+
+        @functools.wraps(fn)
+        def wrapper(arg):
+            try:
+                hash(arg)
+            except TypeError:
+                return fn(arg)
+            return cached(arg)
+
+        return wrapper
+
+    return deco
+
+
+def _memoize_by_identity(fn):
+    """Memoize a single-argument helper on the argument's identity.
+
+    For annotations, where lru_cache's `==` lookup is wrong: typing considers
+    Optional[int] == int | None, Union[int, str] == Union[str, int] and
+    Literal["a", "b"] == Literal["b", "a"], so an equality-keyed cache would
+    echo whichever spelling it saw first (and, under the thread pool, whichever
+    thread got there first). Each entry keeps a strong reference to its key so
+    the id can't be recycled. Works for unhashable arguments too. Unbounded:
+    the registry's distinct annotation objects number in the low thousands.
+    """
+    cache: dict[int, tuple[Any, Any]] = {}
+
+    @functools.wraps(fn)
+    def wrapper(arg):
+        hit = cache.get(id(arg))
+        if hit is not None:
+            return hit[1]
+        result = fn(arg)
+        cache[id(arg)] = (arg, result)
+        return result
+
+    return wrapper
+
+
 # ─────────────────────────────────────────────────────────────
 # Python type → CUE type
 # ─────────────────────────────────────────────────────────────
 
+# Bound once: the sentinel is compared against every parameter's default and
+# annotation, so skip the two attribute lookups per comparison.
+_EMPTY = inspect.Parameter.empty
+
 _PRIMITIVE_MAP = {
     str: "string",
     int: "int",
@@ -111,13 +185,24 @@ _PRIMITIVE_MAP = {
     type(None): "null",
 }
 
+# get_origin() of typing.Sequence[X] / Sequence[X] etc. is the collections.abc
+# class, so membership is an identity check. tuple has its own branch because
+# fixed-length tuples map to CUE tuples, not open lists.
+_SEQUENCE_ORIGINS = frozenset(
+    {list, collections.abc.Sequence, collections.abc.MutableSequence, collections.abc.Iterable}
+)
+_MAPPING_ORIGINS = frozenset({dict, collections.abc.Mapping})
+
 
+@_memoize_by_identity
 def _cue_type(annotation: Any) -> str:  # pylint: disable=too-many-return-statements
     """Convert a Python typing annotation to a CUE type expression.
 
-    Conservative: falls back to '_' (top type) when unsure.
+    Conservative: falls back to '_' (top type) when unsure. Memoized on the
+    annotation object: typing caches parameterized generics (Optional[int] is
+    Optional[int]), so the recurring annotations hit.
     """
-    if annotation is inspect.Parameter.empty or annotation is Any:
+    if annotation is _EMPTY or annotation is Any:
         return "_"
 
     if annotation in _PRIMITIVE_MAP:
@@ -136,9 +221,7 @@ def _cue_type(annotation: Any) -> str:  # pylint: disable=too-many-return-statem
             cue = f"{cue} | null" if cue else "null"
         return cue or "_"
 
-    if origin is list or (
-        origin is not None and getattr(origin, "__name__", "") in ("list", "Sequence", "Iterable")
-    ):
+    if origin in _SEQUENCE_ORIGINS:
         inner = _cue_type(args[0]) if args else "_"
         return f"[...{inner}]"
 
@@ -147,7 +230,7 @@ def _cue_type(annotation: Any) -> str:  # pylint: disable=too-many-return-statem
             return f"[...{_cue_type(args[0])}]"
         return "[" + ", ".join(_cue_type(a) for a in args) + "]"
 
-    if origin is dict or getattr(origin, "__name__", "") == "Mapping":
+    if origin in _MAPPING_ORIGINS:
         if args:
             return f"{{[{_cue_type(args[0])}]: {_cue_type(args[1])}}}"
         return "{...}"
@@ -176,28 +259,32 @@ def _cue_literal(v: Any) -> str:
 # Docstring parsing — extract :param name: text
 # ─────────────────────────────────────────────────────────────
 
-_PARAM_RE = re.compile(r"^\s*:param\s+([a-zA-Z_][\w]*)\s*:\s*(.*)")
+# A `:param name:` block runs until the next line that starts a directive: any
+# line beginning with ':' at column 0, or another (possibly indented) :param.
+# Indented continuation lines, even ones opening with a role like :class:,
+# belong to the block.
+_DIRECTIVE_RE = re.compile(r"^(?::|[ \t]*:param[ \t])", re.M)
+_PARAM_RE = re.compile(
+    r"^[ \t]*:param[ \t]+([a-zA-Z_]\w*)[ \t]*:(.*?)(?=^:|^[ \t]*:param[ \t]|\Z)",
+    re.M | re.S,
+)
 
 
+@_memoize()
 def _parse_docstring(doc: str | None) -> tuple[str, dict[str, str]]:
+    """Split a docstring into (summary, {param: doc}).
+
+    The summary is the prose before the first directive. Both it and each
+    param doc are whitespace-collapsed onto a single line. Memoized: callers
+    parse the same docstring once for params and again for the summary.
+    """
     if not doc:
         return "", {}
-    lines = inspect.cleandoc(doc).split("\n")
-    summary_lines: list[str] = []
-    params: dict[str, str] = {}
-    current: str | None = None
-    for line in lines:
-        m = _PARAM_RE.match(line)
-        if m:
-            current = m.group(1)
-            params[current] = m.group(2).strip()
-        elif line.startswith(":"):
-            current = None
-        elif current and line.strip():
-            params[current] = (params[current] + " " + line.strip()).strip()
-        elif current is None and line.strip() and not line.strip().startswith(":"):
-            summary_lines.append(line.strip())
-    return " ".join(summary_lines).strip(), params
+    doc = inspect.cleandoc(doc)
+    first = _DIRECTIVE_RE.search(doc)
+    summary = " ".join((doc[: first.start()] if first else doc).split())
+    params = {m.group(1): " ".join(m.group(2).split()) for m in _PARAM_RE.finditer(doc)}
+    return summary, params
 
 
 # ─────────────────────────────────────────────────────────────
@@ -205,6 +292,38 @@ def _parse_docstring(doc: str | None) -> tuple[str, dict[str, str]]:
 # ─────────────────────────────────────────────────────────────
 
 
+@_memoize()
+def _type_hints(fn) -> dict[str, Any]:
+    """typing.get_type_hints(fn), or {} if forward refs fail to resolve.
+
+    Memoized per callable: get_type_hints walks module globals to resolve
+    forward refs on every call, and the registry holds the same function under
+    several version specs (and many decorators unwrap to a shared inner fn).
+    """
+    try:
+        return typing.get_type_hints(fn)
+    except Exception:  # pylint: disable=broad-exception-caught
+        return {}
+
+
+# Attributes that point from a wrapper to the callable it wraps, probed in
+# order: functools.wraps' `__wrapped__`, then `fn` for callable wrapper classes
+# (e.g. DictSupportingTensorOp from @supports_dict, whose __call__ may inject
+# extra keyword-only params like `targets`). Deliberately not `func`: peeling a
+# functools.partial would drop its bound arguments.
+_UNWRAP_ATTRS = ("__wrapped__", "fn")
+
+
+def _wrapped_inner(fn):
+    """The callable `fn` directly wraps via one of _UNWRAP_ATTRS, or None."""
+    for attr in _UNWRAP_ATTRS:
+        inner = getattr(fn, attr, None)
+        if callable(inner) and inner is not fn:
+            return inner
+    return None
+
+
+@_memoize()
 def _unwrap(fn):  # pylint: disable=too-many-branches
     """Peel off common decorators to expose the real function.
 
@@ -216,7 +335,7 @@ def _unwrap(fn):  # pylint: disable=too-many-branches
     flags them as unknown fields.
 
     Returns (inner_fn, extra_kwonly_params) where extra_kwonly_params is a
-    list of inspect.Parameter objects to merge into the final signature.
+    tuple of inspect.Parameter objects to merge into the final signature.
     """
     extra: dict[str, inspect.Parameter] = {}
 
@@ -235,15 +354,8 @@ def _unwrap(fn):  # pylint: disable=too-many-branches
     seen = set()
     while id(fn) not in seen:
         seen.add(id(fn))
-        if hasattr(fn, "__wrapped__"):
-            _snapshot_kwonly(fn)
-            fn = fn.__wrapped__
-            continue
-        inner = getattr(fn, "fn", None)
-        if callable(inner) and inner is not fn:
-            # Callable wrapper class (e.g. DictSupportingTensorOp from
-            # @supports_dict) — its __call__ may inject extra keyword-only
-            # params like `targets` on top of the wrapped function's signature.
+        inner = _wrapped_inner(fn)
+        if inner is not None:
             _snapshot_kwonly(fn)
             fn = inner
             continue
@@ -276,12 +388,35 @@ def _unwrap(fn):  # pylint: disable=too-many-branches
                     del extra[name]
         except (TypeError, ValueError):
             pass
-    return fn, list(extra.values())
+    return fn, tuple(extra.values())
+
+
+class _Param(NamedTuple):
+    """One builder parameter. Converted to a dict only when serialized."""
+
+    name: str
+    cue_type: str
+    py_type: str
+    required: bool
+    default: Any
+    doc: str
+
+
+def _make_param(name: str, annotation: Any, default: Any, doc: str) -> _Param:
+    required = default is _EMPTY
+    return _Param(
+        name=name,
+        cue_type=_cue_type(annotation),
+        py_type=_stringify(annotation),
+        required=required,
+        default=None if required else _jsonable(default),
+        doc=doc,
+    )
 
 
 def _collect_init_params(  # pylint: disable=too-many-branches
     cls: type,
-) -> tuple[list[dict[str, Any]], dict[str, str]]:
+) -> tuple[list[_Param], dict[str, str]]:
     """Walk a class's MRO, collecting __init__ parameters + their docs.
 
     - Parameters of more-derived classes override those of bases with the same
@@ -290,7 +425,8 @@ def _collect_init_params(  # pylint: disable=too-many-branches
       — without kwarg forwarding, base-class params aren't reachable from spec.
     - :param docs are merged across the chain, same precedence.
     """
-    params_by_name: dict[str, dict[str, Any]] = {}
+    # name → (annotation, default), in declaration order.
+    params_by_name: dict[str, tuple[Any, Any]] = {}
     param_docs_merged: dict[str, str] = {}
 
     for base in cls.__mro__:
@@ -304,10 +440,7 @@ def _collect_init_params(  # pylint: disable=too-many-branches
             sig = inspect.signature(init)
         except (TypeError, ValueError):
             continue
-        try:
-            hints = typing.get_type_hints(init)
-        except Exception:  # pylint: disable=broad-exception-caught
-            hints = {}
+        hints = _type_hints(init)
         _, docs = _parse_docstring(inspect.getdoc(init))
         for k, v in docs.items():
             param_docs_merged.setdefault(k, v)
@@ -324,32 +457,29 @@ def _collect_init_params(  # pylint: disable=too-many-branches
             # Don't overwrite more-derived declarations.
             if name in params_by_name:
                 continue
-            annotation = hints.get(name, p.annotation)
-            required = p.default is inspect.Parameter.empty
-            default = None if required else p.default
-            params_by_name[name] = {
-                "name": name,
-                "cue_type": _cue_type(annotation),
-                "py_type": _stringify(annotation),
-                "required": required,
-                "default": _jsonable(default),
-                "doc": "",  # filled below
-            }
+            params_by_name[name] = (hints.get(name, p.annotation), p.default)
         if not has_kwargs:
             # This level doesn't forward extra kwargs; bases' extras aren't
             # reachable by callers.
             break
 
     # Attach docs from the merged docstrings.
-    for name, p in params_by_name.items():
-        if not p["doc"] and name in param_docs_merged:
-            p["doc"] = param_docs_merged[name]
-
-    return list(params_by_name.values()), param_docs_merged
+    params = [
+        _make_param(name, annotation, default, param_docs_merged.get(name, ""))
+        for name, (annotation, default) in params_by_name.items()
+    ]
+    return params, param_docs_merged
 
 
 def _introspect(fn) -> dict[str, Any]:  # pylint: disable=too-many-branches
-    extra_kwonly: list[inspect.Parameter] = []
+    """Signature, docs and source location of a registered callable.
+
+    Deliberately not memoized: main() streams each entry's result to disk and
+    drops it, and a cache here would keep every entry's params alive until
+    exit. Entries sharing a callable still reuse the memoized lookups below
+    (_unwrap, _type_hints, _parse_docstring, _source_location, ...).
+    """
+    extra_kwonly: tuple[inspect.Parameter, ...] = ()
     if inspect.isclass(fn):
         target = fn
     else:
@@ -367,46 +497,23 @@ def _introspect(fn) -> dict[str, Any]:  # pylint: disable=too-many-branches
             sig = inspect.signature(target, follow_wrapped=False)
         except (TypeError, ValueError):
             return {"params": [], "summary": "", "file": "", "line": 0}
-        try:
-            hints = typing.get_type_hints(target)
-        except Exception:  # pylint: disable=broad-exception-caught
-            hints = {}
+        hints = _type_hints(target)
         _, param_docs = _parse_docstring(inspect.getdoc(target))
-        params = []
+        params: list[_Param] = []
         seen_names: set[str] = set()
         for name, p in sig.parameters.items():
             if name == "self" or p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
                 continue
             seen_names.add(name)
             annotation = hints.get(name, p.annotation)
-            required = p.default is inspect.Parameter.empty
-            default = None if required else p.default
-            params.append(
-                {
-                    "name": name,
-                    "cue_type": _cue_type(annotation),
-                    "py_type": _stringify(annotation),
-                    "required": required,
-                    "default": _jsonable(default),
-                    "doc": param_docs.get(name, ""),
-                }
-            )
+            params.append(_make_param(name, annotation, p.default, param_docs.get(name, "")))
         # Append wrapper-injected kwargs (e.g. `prob` from @prob_aug). These
         # are real accepted kwargs on the registered callable.
         for p in extra_kwonly:
             if p.name in seen_names:
                 continue
-            required = p.default is inspect.Parameter.empty
-            default = None if required else p.default
             params.append(
-                {
-                    "name": p.name,
-                    "cue_type": _cue_type(p.annotation),
-                    "py_type": _stringify(p.annotation),
-                    "required": required,
-                    "default": _jsonable(default),
-                    "doc": param_docs.get(p.name, ""),
-                }
+                _make_param(p.name, p.annotation, p.default, param_docs.get(p.name, ""))
             )
 
     doc = inspect.getdoc(target)
@@ -414,20 +521,40 @@ def _introspect(fn) -> dict[str, Any]:  # pylint: disable=too-many-branches
         doc = inspect.getdoc(target.__init__)
     summary, _ = _parse_docstring(doc)
 
+    file, line = _source_location(target)
+    return {"params": params, "summary": summary, "file": file, "line": line}
+
+
+@_memoize_by_identity
+def _source_location(obj) -> tuple[str, int]:
+    """(source file, first line) of an unwrapped callable; ("", 0) if unknown.
+
+    Memoized on the callable's identity, so every registration of one
+    underlying function shares a single lookup — getsourcelines re-reads and
+    re-scans the whole source file each time. Not keyed on __code__: code
+    objects compare equal across modules when name, body and first line match
+    (== ignores co_filename), which would hand one function the other's file.
+    """
     try:
-        file = inspect.getsourcefile(target) or ""
+        file = inspect.getsourcefile(obj) or ""
     except TypeError:
         file = ""
     try:
-        line = inspect.getsourcelines(target)[1]
+        line = inspect.getsourcelines(obj)[1]
     except (OSError, TypeError):
         line = 0
-
-    return {"params": params, "summary": summary, "file": file, "line": line}
+    return file, line
 
 
+@_memoize_by_identity
 def _stringify(annotation) -> str:
-    if annotation is inspect.Parameter.empty:
+    """Python-side type string shown in hover (`py_type`).
+
+    Memoized on the annotation object: str() of a parameterized generic
+    re-walks every nested __repr__, and the same few annotations recur across
+    the whole registry.
+    """
+    if annotation is _EMPTY:
         return "Any"
     try:
         return str(annotation)
@@ -435,6 +562,10 @@ def _stringify(annotation) -> str:
         return repr(annotation)
 
 
+_JSON_SCALARS = (str, int, NoneType)  # bool is an int subclass
+_JSON_KEYS = (str, int, float, NoneType)
+
+
 def _jsonable(v):
     """Return a value safe to serialize via strict JSON (no NaN/inf).
 
@@ -443,18 +574,57 @@ def _jsonable(v):
     which VS Code uses) rejects them. We stringify such values so the
     metadata round-trips cleanly.
     """
-    import math  # pylint: disable=import-outside-toplevel
-
-    if isinstance(v, float) and (math.isnan(v) or math.isinf(v)):
-        return repr(v)
+    if isinstance(v, _JSON_SCALARS):
+        # Most defaults; skip the walk entirely.
+        return v
+    if isinstance(v, float):
+        return v if math.isfinite(v) else repr(v)
     if isinstance(v, (list, tuple)):
         out = [_jsonable(x) for x in v]
         return out if isinstance(v, list) else tuple(out)
-    try:
-        json.dumps(v, allow_nan=False)
-        return v
-    except (TypeError, ValueError):
-        return repr(v)
+    return v if _is_json_safe(v) else repr(v)
+
+
+def _is_json_safe(v) -> bool:
+    """True iff json.dumps(v, allow_nan=False) would succeed.
+
+    A direct isinstance walk: probing with json.dumps spins up an encoder and
+    serializes the whole value just to throw the result away, once per default.
+    """
+    if isinstance(v, float):
+        return math.isfinite(v)
+    if isinstance(v, _JSON_SCALARS):
+        return True
+    if isinstance(v, (list, tuple)):
+        return all(map(_is_json_safe, v))
+    if isinstance(v, dict):
+        return all(_is_json_safe_key(k) and _is_json_safe(x) for k, x in v.items())
+    return False
+
+
+def _is_json_safe_key(k) -> bool:
+    # json.dumps coerces these key types to strings, but allow_nan=False still
+    # rejects non-finite float keys.
+    if isinstance(k, float):
+        return math.isfinite(k)
+    return isinstance(k, _JSON_KEYS)
+
+
+def _json_bytes(obj) -> bytes:
+    """Compact UTF-8 JSON for `obj`, via orjson when it's installed.
+
+    The metadata runs to several MB and the stdlib encoder is the slow part of
+    writing it. orjson rejects some values the stdlib accepts (ints beyond 64
+    bits), so those fall back. allow_nan=False on the stdlib path: Node/VS
+    Code's JSON.parse rejects NaN/Inf, so fail loudly if any snuck through
+    _jsonable rather than writing unparseable JSON (orjson emits null instead).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, allow_nan=False).encode()
 
 
 # ─────────────────────────────────────────────────────────────
@@ -467,6 +637,18 @@ def _sanitize(name: str) -> str:
     return "#" + re.sub(r"[^A-Za-z0-9]", "_", name)
 
 
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+
+
+@_memoize(maxsize=1024)
+def _version_suffix(version_spec: str) -> str:
+    """CUE definition suffix for a version spec, e.g. '>=0.0.3' → '_v0_0_3'.
+
+    Memoized: the same handful of specs recur across every multi-version builder.
+    """
+    return "_v" + _NON_DIGIT_RE.sub("_", version_spec).strip("_")
+
+
 def _emit_schema_named(def_name: str, name: str, entry: dict[str, Any]) -> str:
     lines = [f"// {entry['summary']}" if entry["summary"] else f"// {name}"]
     lines.append(f"{def_name}: {{")
@@ -476,31 +658,29 @@ def _emit_schema_named(def_name: str, name: str, entry: dict[str, Any]) -> str:
     lines.append("")
 
     for p in entry["params"]:
-        if p["doc"]:
-            lines.append(f"\t// {p['doc']}")
-        cue_type = p["cue_type"]
+        if p.doc:
+            lines.append(f"\t// {p.doc}")
+        cue_type = p.cue_type
         # Skip fields whose only sensible type is the top type AND no doc — reduces noise.
-        marker = "!" if p["required"] else "?"
-        if p["required"]:
-            lines.append(f'\t{p["name"]}{marker}: {cue_type}')
+        marker = "!" if p.required else "?"
+        if p.required:
+            lines.append(f"\t{p.name}{marker}: {cue_type}")
         else:
-            default = p["default"]
+            default = p.default
             if default is not None and cue_type != "_":
                 lit = _cue_literal(default) if _is_simple_literal(default) else None
                 if lit:
-                    lines.append(f'\t{p["name"]}?: {cue_type} | *{lit}')
+                    lines.append(f"\t{p.name}?: {cue_type} | *{lit}")
                 else:
-                    lines.append(f'\t{p["name"]}?: {cue_type}')
+                    lines.append(f"\t{p.name}?: {cue_type}")
             else:
-                lines.append(f'\t{p["name"]}?: {cue_type}')
+                lines.append(f"\t{p.name}?: {cue_type}")
     lines.append("}")
     lines.append("")
     return "\n".join(lines)
 
 
 def _is_simple_literal(v) -> bool:
-    import math  # pylint: disable=import-outside-toplevel
-
     if v is None:
         return False  # no point emitting `| *null`; just `?` is cleaner
     # CUE has no NaN/inf literals — skip defaults that include them.
@@ -517,23 +697,85 @@ def _is_simple_literal(v) -> bool:
     return False
 
 
+def _process_entry(name: str, entry: Any, single: bool) -> tuple[dict[str, Any], str, str]:
+    """Introspect one registry entry.
+
+    Returns (hover metadata, CUE definition name, CUE schema chunk). Only reads
+    shared state, so it is safe to run concurrently across entries.
+    """
+    intro = _introspect(entry.fn)
+    version_info = {
+        "version_spec": str(entry.version_spec),
+        "allow_partial": entry.allow_partial,
+        "summary": intro["summary"],
+        "file": intro["file"],
+        "line": intro["line"],
+        "params": [p._asdict() for p in intro["params"]],
+    }
+    def_name = _sanitize(name)
+    if not single:
+        def_name += _version_suffix(str(entry.version_spec))
+    return version_info, def_name, _emit_schema_named(def_name, name, intro)
+
+
+def _bounded_map(pool: ThreadPoolExecutor, fn, items, window: int):
+    """Ordered pool.map that keeps at most `window` jobs in flight.
+
+    Executor.map submits every job up front, so finished results pile up in
+    their futures ahead of a slower consumer. Here a job is only submitted once
+    the consumer has taken an earlier result.
+    """
+    pending: collections.deque = collections.deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+@contextlib.contextmanager
+def _atomic_write(path: Path):
+    """Yield a binary file that is os.replace-d onto `path` on clean exit.
+
+    The temp file is unique per run (mkstemp) so concurrent regenerations of
+    the same cache dir (two windows, or the extension plus the lint hook) never
+    share one. On error it is deleted rather than left in the cache dir.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600; match what a plain open() would have produced
+        # so other readers of a shared cache dir keep access.
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
 # ─────────────────────────────────────────────────────────────
 # Entry point
 # ─────────────────────────────────────────────────────────────
 
 
-def main():  # pylint: disable=too-many-locals,too-many-statements
-    t0 = time.perf_counter()
-    # These imports must happen inside main(): zetta_utils is only importable
-    # in the user's active venv, and importing it eagerly would force loading
-    # the heavy ML stack before we're ready to measure it.
-    import importlib  # pylint: disable=import-outside-toplevel
+def _import_builder_modules() -> tuple[list[str], list[tuple[str, str]]]:
+    """Import every zetta_utils module that registers a builder.
 
-    import zetta_utils  # pylint: disable=import-outside-toplevel
-    from zetta_utils.builder.registry import (  # pylint: disable=import-outside-toplevel
-        REGISTRY,
-    )
-    from zetta_utils.builder.scan import get_index  # pylint: disable=import-outside-toplevel
+    Kept out of module scope (like every zetta_utils import here) so that
+    importing extract.py for its helpers stays instant and doesn't require
+    zetta_utils. Returns (missing_deps, broken): modules skipped for an absent
+    third-party dependency, and (module, error) pairs for our own failures.
+    """
+    # pylint: disable=import-outside-toplevel
+    import importlib
+
+    import zetta_utils
+    from zetta_utils.builder.scan import get_index
+
+    # pylint: enable=import-outside-toplevel
 
     # Subpackages expose their builders through lazy __init__.py exports, so a
     # bundle import (load_all_modules) binds the subpackage names without ever
@@ -563,10 +805,34 @@ def main():  # pylint: disable=too-many-locals,too-many-statements
             # Record it so the run can fail loudly rather than ship a silently
             # incomplete schema.
             broken.append((module, f"{type(exc).__name__}: {exc}"))
-    t1 = time.perf_counter()
+    return missing_deps, broken
+
 
+def main():  # pylint: disable=too-many-locals,too-many-statements
+    t0 = time.perf_counter()
+    # These imports must happen inside main(): zetta_utils is only importable
+    # in the user's active venv, and importing it eagerly would force loading
+    # the heavy ML stack before we're ready to measure it.
+    import zetta_utils  # pylint: disable=import-outside-toplevel
+
+    # Hash the source tree on a background thread while the module imports
+    # below run: hashing is file reads + hashlib (both release the GIL), so it
+    # overlaps with import work instead of adding to it. Imports themselves
+    # stay sequential — REGISTRY's per-name entry order follows import order,
+    # and the alias fallback depends on it.
     zu_pkg_dir = Path(zetta_utils.__file__).parent
-    key = _cache_key(zu_pkg_dir)
+    hasher = ThreadPoolExecutor(max_workers=1)
+    key_future = hasher.submit(_cache_key, zu_pkg_dir)
+
+    from zetta_utils.builder.registry import (  # pylint: disable=import-outside-toplevel
+        REGISTRY,
+    )
+
+    missing_deps, broken = _import_builder_modules()
+    t1 = time.perf_counter()
+
+    key = key_future.result()
+    hasher.shutdown()
 
     cache_dir = _cache_root(zu_pkg_dir) / key
     cache_dir.mkdir(parents=True, exist_ok=True)
@@ -580,13 +846,13 @@ def main():  # pylint: disable=too-many-locals,too-many-statements
         _dynamic_resolvers,
     )
 
-    metadata: dict[str, Any] = {
+    # Everything in metadata.json except "builders", which is streamed below.
+    header: dict[str, Any] = {
         "generated_at": time.time(),
         "cache_key": key,
         # Absolute path to the zetta_utils source dir the extension can re-hash
         # to decide whether the cache is still fresh.
         "source_path": str(zu_pkg_dir),
-        "builders": {},
         "dynamic_prefixes": [prefix for prefix, _ in _dynamic_resolvers],
     }
     schema_chunks: list[str] = [
@@ -600,70 +866,87 @@ def main():  # pylint: disable=too-many-locals,too-many-statements
     # Single-entry builders get the unsuffixed name (#foo).
     # Multi-entry builders get per-spec names (#foo_v0_0_3) plus an alias
     # #foo pointing at the newest (">=" spec wins; else the first entry).
+    #
+    # Entries are independent, so introspect them on a thread pool: getsourcefile
+    # / getsourcelines stat and read source files, which overlaps across threads.
+    # Results come back in job order, so the output is identical to a
+    # sequential run.
+    #
+    # Each builder's metadata is written out as soon as its entries are done
+    # rather than accumulated into one dict. With _bounded_map capping the
+    # results in flight and _introspect uncached, per-entry metadata is not
+    # retained; what stays resident is the schema text (joined at the end) and
+    # the small per-callable lookup caches. It goes to a temp file renamed into
+    # place at the end (see below).
+    schemas_path = cache_dir / "schemas.cue"
+    metadata_path = cache_dir / "metadata.json"
     per_name_defs: dict[str, list[tuple[str, str]]] = {}
-    for name, entries in sorted(REGISTRY.items()):
-        metadata["builders"][name] = []
-        for entry in entries:
-            intro = _introspect(entry.fn)
-            # Store metadata for hover.
-            metadata["builders"][name].append(
-                {
-                    "version_spec": str(entry.version_spec),
-                    "allow_partial": entry.allow_partial,
-                    "summary": intro["summary"],
-                    "file": intro["file"],
-                    "line": intro["line"],
-                    "params": intro["params"],
-                }
+    # Snapshot the entry lists: jobs and the writer below must agree on each
+    # builder's entry count, and a worker's forward-ref resolution can trigger
+    # a lazy import that registers more entries mid-sweep.
+    registry = [(name, tuple(entries)) for name, entries in sorted(REGISTRY.items())]
+    jobs = [(name, entry, len(entries) == 1) for name, entries in registry for entry in entries]
+    # Both files land via os.replace so the extension and the lint hook, which
+    # may read the cache dir mid-run, never see a half-written one.
+    # metadata.json goes last: the extension only loads a cache dir once both
+    # files exist, so its replace is the outer context's exit.
+    with _atomic_write(metadata_path) as meta_f:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = _bounded_map(pool, lambda job: _process_entry(*job), jobs, window=32)
+            meta_f.write(b"{")
+            for k, v in header.items():
+                meta_f.write(_json_bytes(k) + b":" + _json_bytes(v) + b",")
+            meta_f.write(b'"builders":{')
+            for i, (name, entries) in enumerate(registry):
+                versions: list[dict[str, Any]] = []
+                for entry, (version_info, def_name, chunk) in zip(
+                    entries, itertools.islice(results, len(entries))
+                ):
+                    versions.append(version_info)
+                    schema_chunks.append(chunk)
+                    per_name_defs.setdefault(name, []).append(
+                        (def_name, str(entry.version_spec))
+                    )
+                meta_f.write(
+                    (b"," if i else b"") + _json_bytes(name) + b":" + _json_bytes(versions)
+                )
+            meta_f.write(b"}}")
+
+        # Emit aliases for multi-version builders. The alias points at the entry
+        # whose version_spec matches DEFAULT_VERSION ("0.0.0"), mirroring the
+        # Python registry's get_matching_entry() behavior.
+        # pylint: disable=import-outside-toplevel
+        from packaging.specifiers import SpecifierSet
+        from packaging.version import Version
+
+        from zetta_utils.builder import constants as _constants
+
+        # pylint: enable=import-outside-toplevel
+        default_version = Version(_constants.DEFAULT_VERSION)
+
+        schema_chunks.append("// ─── default-version aliases ───")
+        for name, variants in sorted(per_name_defs.items()):
+            if len(variants) <= 1:
+                continue
+            default_variant = next(
+                (v for v in variants if default_version in SpecifierSet(v[1])),
+                variants[0],
             )
-            # Generate the CUE schema chunk.
-            single = len(entries) == 1
-            def_name = _sanitize(name)
-            if not single:
-                def_name += "_v" + re.sub(r"[^0-9]", "_", str(entry.version_spec)).strip("_")
-            chunk = _emit_schema_named(def_name, name, intro)
-            schema_chunks.append(chunk)
-            per_name_defs.setdefault(name, []).append((def_name, str(entry.version_spec)))
-
-    # Emit aliases for multi-version builders. The alias points at the entry
-    # whose version_spec matches DEFAULT_VERSION ("0.0.0"), mirroring the
-    # Python registry's get_matching_entry() behavior.
-    # pylint: disable=import-outside-toplevel
-    from packaging.specifiers import SpecifierSet
-    from packaging.version import Version
+            alias = _sanitize(name)
+            schema_chunks.append(f"{alias}: {default_variant[0]}")
+        schema_chunks.append("")
 
-    from zetta_utils.builder import constants as _constants
+        # NOTE: No #Builder union is emitted. A 1700-branch recursive disjunction
+        # caused cue vet to explode (30s+ on a 650-line spec). Validation happens
+        # per-@type-occurrence via probe sidecars emitted by the extension.
 
-    # pylint: enable=import-outside-toplevel
-    default_version = Version(_constants.DEFAULT_VERSION)
-
-    schema_chunks.append("// ─── default-version aliases ───")
-    for name, variants in sorted(per_name_defs.items()):
-        if len(variants) <= 1:
-            continue
-        default_variant = next(
-            (v for v in variants if default_version in SpecifierSet(v[1])),
-            variants[0],
-        )
-        alias = _sanitize(name)
-        schema_chunks.append(f"{alias}: {default_variant[0]}")
-    schema_chunks.append("")
-
-    # NOTE: No #Builder union is emitted. A 1700-branch recursive disjunction
-    # caused cue vet to explode (30s+ on a 650-line spec). Validation happens
-    # per-@type-occurrence via probe sidecars emitted by the extension.
-
-    schemas_path = cache_dir / "schemas.cue"
-    metadata_path = cache_dir / "metadata.json"
-    schemas_path.write_text("\n".join(schema_chunks))
-    # allow_nan=False: Node/VS Code's JSON.parse rejects NaN/Inf; fail loudly
-    # here if any snuck through _jsonable rather than writing unparseable JSON.
-    metadata_path.write_text(json.dumps(metadata, allow_nan=False))
+        with _atomic_write(schemas_path) as schemas_f:
+            schemas_f.write("\n".join(schema_chunks).encode())
 
     removed = _cleanup_old_caches(cache_dir.parent, keep=key, keep_n=3)
 
     t2 = time.perf_counter()
-    total_entries = sum(len(v) for v in REGISTRY.values())
+    total_entries = len(jobs)
     print(f"cache key:        {key}", file=sys.stderr)
     print(f"cache dir:        {cache_dir}", file=sys.stderr)
     print(